@@ -0,0 +1,50 @@
+"""
+Shared environment helpers for the scripts in this directory.
+
+Each script loads .env.local from the project root the same way the
+Next.js app does, without overriding variables already in the environment.
+"""
+
+import os
+from pathlib import Path
+
+# .env.local in the project root (parent of scripts/), resolved once at import
+ENV_FILE = Path(__file__).resolve().parent.parent / ".env.local"
+
+
+def load_env_from_file(log_prefix: str, env_path: Path = ENV_FILE) -> None:
+  """
+  Minimal .env loader for .env.local
+  - Supports KEY=VALUE lines
+  - Ignores blank lines and comments
+  - Does not override already-set environment variables
+  """
+  if not env_path.exists():
+    print(f"[{log_prefix}] .env file not found at {env_path}, relying on existing environment")
+    return
+
+  print(f"[{log_prefix}] Loading environment from {env_path}")
+
+  with env_path.open() as f:
+    for raw in f:
+      line = raw.strip()
+      if not line or line.startswith("#"):
+        continue
+
+      key, sep, value = line.partition("=")
+      if not sep:
+        continue
+
+      key = key.strip()
+      value = value.strip().strip('"').strip("'")
+
+      # Don't override variables already present in the environment
+      if key and key not in os.environ:
+        os.environ[key] = value
+
+
+def get_env_var(name: str) -> str:
+  value = os.environ.get(name)
+  if not value:
+    raise SystemExit(f"Environment variable {name} is not set")
+  return value
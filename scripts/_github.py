@@ -0,0 +1,95 @@
+"""
+Shared GitHub REST client helpers for the scripts in this directory.
+
+Each script builds its own connection pool with make_pool() and sets its
+User-Agent (and, once the token is loaded, Authorization) on GITHUB_HEADERS.
+"""
+
+import json
+import ssl
+from typing import Mapping, Sequence, Tuple
+
+try:
+  import urllib3
+  from urllib3.util.retry import Retry
+except ImportError:
+  raise SystemExit("Error: 'urllib3' package not installed. Run: pip install urllib3")
+
+# orjson is optional; it encodes and decodes JSON several times faster
+try:
+  from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+  from json import loads as _loads
+
+  def _dumps(obj: object) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+GITHUB_API_BASE = "https://api.github.com"
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Sent with every request; scripts add their User-Agent and Authorization
+GITHUB_HEADERS = {
+  "Accept": "application/vnd.github+json",
+}
+
+# Transient failures retried by the urllib3 pool; scripts with their own
+# transport (e.g. HTTP/2 deletes) reuse the same budget
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (502, 503, 504)
+
+# One TLS context (CA bundle loaded once) shared by every pooled connection
+try:
+  import certifi
+  TLS_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+except ImportError:
+  TLS_CONTEXT = ssl.create_default_context()
+
+
+def make_pool(maxsize: int, socket_options: Sequence[tuple] | None = None) -> urllib3.PoolManager:
+  """
+  Keep-alive pool to api.github.com. urllib3 is used directly to avoid
+  requests' per-call PreparedRequest/Session machinery.
+  """
+  # An explicit socket_options=None would drop urllib3's TCP_NODELAY default
+  extra = {"socket_options": socket_options} if socket_options is not None else {}
+  return urllib3.PoolManager(
+    num_pools=1,
+    maxsize=maxsize,
+    retries=Retry(
+      total=RETRY_TOTAL,
+      backoff_factor=RETRY_BACKOFF_FACTOR,
+      status_forcelist=RETRY_STATUSES,
+      raise_on_status=False,
+    ),
+    timeout=30,
+    ssl_context=TLS_CONTEXT,
+    **extra,
+  )
+
+
+def call_github(
+  pool: urllib3.PoolManager,
+  method: str,
+  url: str,
+  data: bytes | None = None,
+  headers: Mapping[str, str] | None = None,
+) -> Tuple[int, dict | None, Mapping[str, str]]:
+  """
+  Sends a request on `pool` with GITHUB_HEADERS plus any extra headers.
+  Callers pass already-serialized bodies together with JSON_HEADERS.
+  """
+  resp = pool.request(
+    method, url, body=data, headers={**GITHUB_HEADERS, **headers} if headers else GITHUB_HEADERS
+  )
+
+  parsed: dict | None = None
+  # DELETE answers 204 with no body; skip decoding entirely
+  if resp.status != 204 and resp.data:
+    try:
+      parsed = _loads(resp.data)
+    except ValueError:
+      parsed = {"raw": resp.data.decode("utf-8", "replace")}
+  return resp.status, parsed, resp.headers
@@ -6,145 +6,435 @@ This script:
   1. Lists all repositories in the organization
   2. Displays them to the user
   3. Requires explicit confirmation before proceeding
-  4. Deletes each repository one by one
+  4. Deletes the repositories concurrently over a shared connection pool
 
 Usage:
-  python scripts/delete_all_repos.py
+  python scripts/delete_all_repos.py [--quiet]
+
+Options:
+  --quiet   Skip printing the full repository list before confirmation
 
 Environment variables (from .env.local or environment):
   - GITHUB_ORG_NAME
   - GITHUB_PAT
 
 ⚠️  WARNING: This operation is IRREVERSIBLE!
+
+Note: Requires the 'urllib3' Python package: pip install urllib3
+If 'httpx' with HTTP/2 support is installed (pip install "httpx[http2]"),
+deletes are multiplexed over a single HTTP/2 connection instead of a thread pool.
 """
 
+import asyncio
 import json
 import os
+import socket
 import sys
-import urllib.error
-import urllib.request
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Mapping
+from urllib.parse import parse_qs, urlparse
+
+from _env import get_env_var, load_env_from_file
+from _github import (
+  GITHUB_API_BASE,
+  GITHUB_HEADERS,
+  JSON_HEADERS,
+  RETRY_BACKOFF_FACTOR,
+  RETRY_STATUSES,
+  RETRY_TOTAL,
+  TLS_CONTEXT,
+  _dumps,
+  _loads,
+  call_github,
+  make_pool,
+)
+from urllib3.connection import HTTPConnection
+
+# httpx is optional; with the h2 extra it lets every DELETE share one connection
+try:
+  import h2  # noqa: F401
+  import httpx
+except ImportError:
+  httpx = None
+
+
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_BASE}/graphql"
+REPOS_PER_PAGE = 100
+
+# ETags and compact page bodies from earlier REST listings, so unchanged
+# pages come back as 304 Not Modified on re-runs
+REPO_CACHE_PATH = Path.home() / ".cache" / "dyno-apps" / "repos.json"
+
+# Only the fields the script uses, so each page is a fraction of the REST payload
+REPOS_QUERY = """
+query($org: String!, $cursor: String) {
+  organization(login: $org) {
+    repositories(first: 100, after: $cursor) {
+      nodes { name isPrivate }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
+
+# Concurrent requests in flight; must not exceed the pool's maxsize
+MAX_WORKERS = 8
+
+# Concurrent HTTP/2 streams used for deletes when httpx is available
+MAX_STREAMS = 20
+
+GITHUB_HEADERS["User-Agent"] = "dyno-apps-delete-all-repos-script"
 
+# Small request/response exchanges: keep TCP_NODELAY (urllib3's default) so
+# Nagle never holds back a DELETE, and let the kernel probe idle pooled sockets
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+  (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
 
-GITHUB_API_BASE = "https://api.github.com"
+# One keep-alive pool shared by the list and delete phases, so every call
+# after the first reuses a TLS connection to api.github.com
+pool = make_pool(maxsize=16, socket_options=SOCKET_OPTIONS)
 
 
-def load_env_from_file(env_path: Path) -> None:
+# GitHub asks for at least a minute's wait on secondary rate limits that
+# come without a Retry-After header
+SECONDARY_RATE_LIMIT_DELAY = 60.0
+
+
+def parse_retry_after(value: str) -> float | None:
   """
-  Minimal .env loader for .env.local
-  - Supports KEY=VALUE lines
-  - Ignores blank lines and comments
-  - Does not override already-set environment variables
+  Parses a Retry-After header given as seconds or as an HTTP date.
+  Returns None if the value is neither.
   """
-  if not env_path.exists():
-    print(f"[delete-all-repos] .env file not found at {env_path}, relying on existing environment")
-    return
+  try:
+    return max(float(value), 0.0)
+  except ValueError:
+    pass
+  try:
+    return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+  except (TypeError, ValueError):
+    return None
 
-  print(f"[delete-all-repos] Loading environment from {env_path}")
 
-  for line in env_path.read_text().splitlines():
-    line = line.strip()
-    if not line or line.startswith("#"):
-      continue
-    if "=" not in line:
-      continue
+def rate_limit_delay(
+  status: int, headers: Mapping[str, str], body: dict | None = None
+) -> float | None:
+  """
+  Returns how many seconds to back off if the response was rate limited,
+  or None if it was not.
+  """
+  if status not in (403, 429):
+    return None
+
+  message = str((body or {}).get("message", "")).lower()
+  secondary = "secondary rate limit" in message
+
+  retry_after = headers.get("Retry-After")
+  if retry_after:
+    delay = parse_retry_after(retry_after)
+    if delay is not None:
+      return delay
+    if secondary or status == 429:
+      return SECONDARY_RATE_LIMIT_DELAY
+  if headers.get("X-RateLimit-Remaining") == "0":
+    try:
+      reset_at = float(headers.get("X-RateLimit-Reset", "0"))
+    except ValueError:
+      reset_at = 0.0
+    return max(reset_at - time.time(), 1.0)
+  if secondary:
+    return SECONDARY_RATE_LIMIT_DELAY
+  return None
 
-    key, value = line.split("=", 1)
-    key = key.strip()
-    value = value.strip().strip('"').strip("'")
 
-    # Don't override variables already present in the environment
-    if key and key not in os.environ:
-      os.environ[key] = value
+def list_all_repos_graphql(org: str) -> List[Dict] | None:
+  """
+  Lists all repositories in the organization via the GraphQL API.
+  Returns None if the query is rejected (e.g. the token lacks read:org),
+  so the caller can fall back to the REST listing.
+  """
+  print(f"[delete-all-repos] Fetching repositories from {org} (GraphQL)...")
 
+  repos: List[Dict] = []
+  cursor = None
+  page = 1
 
-def get_env_var(name: str) -> str:
-  value = os.environ.get(name)
-  if not value:
-    raise SystemExit(f"Environment variable {name} is not set")
-  return value
+  while True:
+    status, body, _ = call_github(
+      pool,
+      "POST",
+      GITHUB_GRAPHQL_URL,
+      data=_dumps({"query": REPOS_QUERY, "variables": {"org": org, "cursor": cursor}}),
+      headers=JSON_HEADERS,
+    )
+
+    if status != 200 or not body or body.get("errors"):
+      print(f"[delete-all-repos] GraphQL listing unavailable (HTTP {status}), falling back to REST")
+      return None
+
+    organization = (body.get("data") or {}).get("organization")
+    if not organization:
+      print("[delete-all-repos] GraphQL returned no organization, falling back to REST")
+      return None
+
+    connection = organization["repositories"]
+    for node in connection["nodes"]:
+      repos.append({"name": node["name"], "private": node["isPrivate"]})
+    print(f"  Fetched page {page}: {len(connection['nodes'])} repositories (total: {len(repos)})")
+
+    page_info = connection["pageInfo"]
+    if not page_info["hasNextPage"]:
+      return repos
+
+    cursor = page_info["endCursor"]
+    page += 1
 
 
-def build_request(
-  method: str, url: str, token: str, body: dict | None = None
-) -> urllib.request.Request:
-  headers = {
-    "Authorization": f"Bearer {token}",
-    "Accept": "application/vnd.github+json",
-    "User-Agent": "dyno-apps-delete-all-repos-script",
+def load_repo_cache() -> Dict[str, Dict]:
+  """
+  Loads the on-disk cache: {"pages": {url: page}, "orgs": {url: org}}.
+  Returns an empty cache if the file is absent or unreadable.
+  """
+  try:
+    with REPO_CACHE_PATH.open() as f:
+      cache = json.load(f)
+  except (OSError, ValueError):
+    cache = None
+  if not isinstance(cache, dict):
+    cache = {}
+  return {
+    key: cache[key] if isinstance(cache.get(key), dict) else {}
+    for key in ("pages", "orgs")
   }
-  data = None
-  if body is not None:
-    data = json.dumps(body).encode("utf-8")
-    headers["Content-Type"] = "application/json"
-
-  req = urllib.request.Request(url, data=data, headers=headers, method=method)
-  return req
 
 
-def call_github(req: urllib.request.Request) -> Tuple[int, dict | None]:
+def save_repo_cache(cache: Dict[str, Dict]) -> None:
   try:
-    with urllib.request.urlopen(req) as resp:
-      status = resp.getcode()
-      raw = resp.read().decode("utf-8") or ""
-  except urllib.error.HTTPError as e:
-    status = e.code
-    raw = e.read().decode("utf-8") if e.fp else ""
-
-  body: dict | None = None
-  if raw:
-    try:
-      body = json.loads(raw)
-    except json.JSONDecodeError:
-      body = {"raw": raw}
-  return status, body
+    REPO_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = REPO_CACHE_PATH.with_suffix(".tmp")
+    with tmp_path.open("w") as f:
+      json.dump(cache, f)
+    os.replace(tmp_path, REPO_CACHE_PATH)
+  except OSError as e:
+    print(f"[delete-all-repos] Could not write repo cache: {e}")
+
+
+def fetch_repo_page(
+  list_url: str, page: int, cache: Dict[str, Dict]
+) -> Tuple[List[Dict], Mapping[str, str]]:
+  """
+  Fetches one page of the organization's repositories, revalidating any
+  cached copy with If-None-Match. Returns (repos, response headers).
+  """
+  url = list_url + str(page)
+  cached = cache.get(url)
+  request_headers = {"If-None-Match": cached["etag"]} if cached else None
+  status, body, headers = call_github(pool, "GET", url, headers=request_headers)
+
+  if status == 304 and cached:
+    return cached["repos"], {"Link": cached.get("link", "")}
+
+  if status != 200:
+    raise SystemExit(f"Failed to list repositories: HTTP {status}\n{json.dumps(body, indent=2)}")
 
+  if not isinstance(body, list):
+    raise SystemExit(f"Unexpected response format: {body}")
 
-def list_all_repos(org: str, token: str) -> List[Dict]:
+  repos = [{"name": repo.get("name"), "private": repo.get("private", False)} for repo in body]
+  etag = headers.get("ETag")
+  if etag:
+    cache[url] = {"etag": etag, "link": headers.get("Link", ""), "repos": repos}
+  return repos, headers
+
+
+def last_page_number(headers: Mapping[str, str]) -> int | None:
+  """
+  Reads the total page count from the Link header's rel="last" entry.
+  Returns None if there is no such entry.
+  """
+  link = headers.get("Link")
+  if not link:
+    return None
+  # Entries look like: <https://api.github.com/...&page=4>; rel="last"
+  for entry in link.split(","):
+    target, _, params = entry.partition(";")
+    if 'rel="last"' in params:
+      page = parse_qs(urlparse(target.strip(" <>")).query).get("page")
+      return int(page[0]) if page else None
+  return None
+
+
+def list_all_repos(org: str) -> List[Dict]:
   """
   Lists all repositories in the organization.
-  Handles pagination automatically.
+  Pages are fetched concurrently once the page count is known from the
+  first page's Link header and the org's repo count. Pages and the count
+  are cached by ETag between runs.
   """
-  repos = []
-  page = 1
-  per_page = 100
-  
   print(f"[delete-all-repos] Fetching repositories from {org}...")
-  
+
+  cache = load_repo_cache()
+  try:
+    return list_repo_pages(org, cache)
+  finally:
+    save_repo_cache(cache)
+
+
+def org_repo_count(org: str, cache: Dict[str, Dict]) -> int | None:
+  """
+  Returns the organization's public + private repository count, or None if
+  the private count is not visible to this token. Revalidated by ETag.
+  """
+  url = f"{GITHUB_API_BASE}/orgs/{org}"
+  cached = cache.get(url)
+  request_headers = {"If-None-Match": cached["etag"]} if cached else None
+  status, body, headers = call_github(pool, "GET", url, headers=request_headers)
+
+  if status == 304 and cached:
+    return cached["count"]
+
+  if status != 200 or not isinstance(body, dict) or "total_private_repos" not in body:
+    return None
+
+  count = body.get("public_repos", 0) + body["total_private_repos"]
+  etag = headers.get("ETag")
+  if etag:
+    cache[url] = {"etag": etag, "count": count}
+  return count
+
+
+def fetch_repo_pages(list_url: str, page_numbers: range, cache: Dict[str, Dict]) -> List[List[Dict]]:
+  """
+  Fetches the given pages concurrently. Returns them in page order.
+  """
+  pages: List[List[Dict]] = [[] for _ in page_numbers]
+  with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(page_numbers))) as executor:
+    futures = {
+      executor.submit(fetch_repo_page, list_url, page, cache): i
+      for i, page in enumerate(page_numbers)
+    }
+    for fut in as_completed(futures):
+      i = futures[fut]
+      pages[i], _ = fut.result()
+      print(f"  Fetched page {page_numbers[i]}: {len(pages[i])} repositories")
+  return pages
+
+
+def list_repo_pages(org: str, cache: Dict[str, Dict]) -> List[Dict]:
+  # Only the page number varies between requests; a stable sort keeps
+  # concurrently fetched pages from overlapping
+  list_url = (
+    f"{GITHUB_API_BASE}/orgs/{org}/repos"
+    f"?per_page={REPOS_PER_PAGE}&type=all&sort=full_name&direction=asc&page="
+  )
+  page_cache = cache["pages"]
+
+  # Page 1 and the org's repo count are requested together, so small orgs
+  # still finish listing in a single round trip
+  with ThreadPoolExecutor(max_workers=2) as executor:
+    count_future = executor.submit(org_repo_count, org, cache["orgs"])
+    first, headers = fetch_repo_page(list_url, 1, page_cache)
+    print(f"  Fetched page 1: {len(first)} repositories")
+    total = count_future.result()
+
+  if len(first) < REPOS_PER_PAGE:
+    return first
+
+  last = last_page_number(headers)
+  # Page 1 came back full, so there is at least one page whatever the count says
+  counted = max(-(-total // REPOS_PER_PAGE), 1) if total is not None else None
+  if last is None:
+    if counted is None:
+      return list_repos_serially(list_url, first, 2, page_cache)
+    # GitHub leaves out the Link header when everything fits on one page
+    if counted == 1:
+      last = 1
+
+  page_count = max(page for page in (last, counted) if page is not None)
+  pages = fetch_repo_pages(list_url, range(2, page_count + 1), page_cache) if page_count > 1 else []
+  repos = first + [repo for page in pages for repo in page]
+
+  # Only when the Link header and the count disagree (or the Link header is
+  # missing) can there be more pages than requested; probe past the last
+  # fetched page for them then
+  last_fetched = pages[-1] if pages else first
+  disagree = last != counted
+  if disagree and len(last_fetched) == REPOS_PER_PAGE:
+    return list_repos_serially(list_url, repos, page_count + 1, page_cache)
+  return repos
+
+
+def list_repos_serially(
+  list_url: str, repos: List[Dict], page: int, cache: Dict[str, Dict]
+) -> List[Dict]:
+  """
+  Keeps requesting pages from `page` onwards until a short page comes back.
+  Used when the page count is unknown or turned out to be too low.
+  """
+  repos = list(repos)
+
   while True:
-    url = f"{GITHUB_API_BASE}/orgs/{org}/repos?page={page}&per_page={per_page}&type=all"
-    req = build_request("GET", url, token)
-    status, body = call_github(req)
-    
-    if status != 200:
-      raise SystemExit(f"Failed to list repositories: HTTP {status}\n{json.dumps(body, indent=2)}")
-    
-    if not body or not isinstance(body, list):
-      raise SystemExit(f"Unexpected response format: {body}")
-    
+    body, _ = fetch_repo_page(list_url, page, cache)
     if len(body) == 0:
       break
-    
+
     repos.extend(body)
     print(f"  Fetched page {page}: {len(body)} repositories (total: {len(repos)})")
-    
-    if len(body) < per_page:
+
+    if len(body) < REPOS_PER_PAGE:
       break
-    
+
     page += 1
-  
+
   return repos
 
 
-def delete_repo(org: str, token: str, repo_name: str) -> Tuple[bool, str]:
+# Shared back-off deadline so one rate-limited response pauses every worker
+_backoff_lock = threading.Lock()
+_resume_at = 0.0
+
+
+def wait_for_backoff() -> None:
+  with _backoff_lock:
+    delay = _resume_at - time.time()
+  if delay > 0:
+    time.sleep(delay)
+
+
+def start_backoff(delay: float) -> None:
+  global _resume_at
+  with _backoff_lock:
+    _resume_at = max(_resume_at, time.time() + delay)
+
+
+class RateLimited(Exception):
+  def __init__(self, delay: float) -> None:
+    super().__init__(f"rate limited, retry in {delay:.0f}s")
+    self.delay = delay
+
+
+def delete_repo(repo_url_prefix: str, repo_name: str) -> Tuple[bool, str]:
   """
   Deletes a repository. Returns (success, message).
+  Raises RateLimited if GitHub asks us to back off.
   """
-  url = f"{GITHUB_API_BASE}/repos/{org}/{repo_name}"
-  req = build_request("DELETE", url, token)
-  status, body = call_github(req)
-  
+  url = repo_url_prefix + repo_name
+  wait_for_backoff()
+  status, body, headers = call_github(pool, "DELETE", url)
+
+  delay = rate_limit_delay(status, headers, body)
+  if delay is not None:
+    start_backoff(delay)
+    raise RateLimited(delay)
+
+  return delete_result(repo_name, status, body)
+
+
+def delete_result(repo_name: str, status: int, body: dict | None) -> Tuple[bool, str]:
   if status == 204:
     return True, f"✅ Successfully deleted {repo_name}"
   elif status == 404:
@@ -154,6 +444,136 @@ def delete_repo(org: str, token: str, repo_name: str) -> Tuple[bool, str]:
     return False, f"❌ Failed to delete {repo_name}: {error_msg}"
 
 
+def delete_repos_threaded(repo_url_prefix: str, names: List[str]) -> Tuple[int, int]:
+  """
+  Deletes repositories on a thread pool sharing the connection pool.
+  Returns (success_count, fail_count).
+  """
+  success_count = 0
+  fail_count = 0
+  done = 0
+
+  with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    pending: Dict[Future, str] = {
+      executor.submit(delete_repo, repo_url_prefix, name): name for name in names
+    }
+
+    while pending:
+      finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+      for fut in finished:
+        name = pending.pop(fut)
+        try:
+          success, message = fut.result()
+        except RateLimited as e:
+          print(f"⏳ {name}: {e}")
+          pending[executor.submit(delete_repo, repo_url_prefix, name)] = name
+          continue
+        except Exception as e:
+          success, message = False, f"❌ Failed to delete {name}: {e}"
+
+        done += 1
+        print(f"[{done}/{len(names)}] {message}")
+
+        if success:
+          success_count += 1
+        else:
+          fail_count += 1
+
+  return success_count, fail_count
+
+
+def retry_backoff(retries: int, retry_after: str | None = None) -> float:
+  """
+  Seconds to wait before retry number `retries`: the server's Retry-After
+  when it sent a usable one, exponential backoff otherwise.
+  """
+  if retry_after:
+    delay = parse_retry_after(retry_after)
+    if delay is not None:
+      return delay
+  return RETRY_BACKOFF_FACTOR * 2 ** (retries - 1)
+
+
+async def delete_repo_async(
+  client: "httpx.AsyncClient", semaphore: asyncio.Semaphore, repo_url_prefix: str, repo_name: str
+) -> Tuple[bool, str]:
+  """
+  Deletes a repository over the shared HTTP/2 client. Returns (success, message).
+  Rate-limited requests wait out the shared back-off and are retried. 5xx
+  gateway errors and transport errors share one budget of RETRY_TOTAL retries
+  with exponential backoff (or the server's Retry-After), matching the urllib3
+  pool's Retry policy.
+  """
+  url = repo_url_prefix + repo_name
+  retries = 0
+  while True:
+    await asyncio.sleep(max(_resume_at - time.time(), 0))
+    try:
+      async with semaphore:
+        resp = await client.delete(url)
+    except httpx.TransportError as e:
+      if retries < RETRY_TOTAL:
+        retries += 1
+        await asyncio.sleep(retry_backoff(retries))
+        continue
+      return False, f"❌ Failed to delete {repo_name}: {e}"
+    except httpx.HTTPError as e:
+      return False, f"❌ Failed to delete {repo_name}: {e}"
+
+    if resp.status_code in RETRY_STATUSES and retries < RETRY_TOTAL:
+      retries += 1
+      await asyncio.sleep(retry_backoff(retries, resp.headers.get("Retry-After")))
+      continue
+
+    body = None
+    if resp.status_code != 204 and resp.content:
+      try:
+        body = _loads(resp.content)
+      except ValueError:
+        body = {"raw": resp.text}
+
+    delay = rate_limit_delay(resp.status_code, resp.headers, body)
+    if delay is None:
+      break
+    start_backoff(delay)
+    print(f"⏳ {repo_name}: {RateLimited(delay)}")
+
+  return delete_result(repo_name, resp.status_code, body)
+
+
+async def delete_repos_http2(repo_url_prefix: str, names: List[str]) -> Tuple[int, int]:
+  """
+  Deletes repositories as concurrent streams on one HTTP/2 connection.
+  Returns (success_count, fail_count).
+  """
+  success_count = 0
+  fail_count = 0
+  semaphore = asyncio.Semaphore(MAX_STREAMS)
+
+  transport = httpx.AsyncHTTPTransport(
+    http2=True,
+    verify=TLS_CONTEXT,
+    limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+    socket_options=SOCKET_OPTIONS,
+  )
+  async with httpx.AsyncClient(
+    transport=transport,
+    headers=GITHUB_HEADERS,
+    timeout=30,
+  ) as client:
+    tasks = [delete_repo_async(client, semaphore, repo_url_prefix, name) for name in names]
+    for done, task in enumerate(asyncio.as_completed(tasks), 1):
+      success, message = await task
+      print(f"[{done}/{len(names)}] {message}")
+
+      if success:
+        success_count += 1
+      else:
+        fail_count += 1
+
+  return success_count, fail_count
+
+
 def confirm_deletion(repo_count: int, org: str) -> bool:
   """
   Asks for explicit confirmation from the user.
@@ -178,21 +598,30 @@ def confirm_deletion(repo_count: int, org: str) -> bool:
     return False
 
 
-def main() -> None:
+def main(argv: list[str]) -> None:
+  if any(arg != "--quiet" for arg in argv[1:]):
+    print("Usage: python scripts/delete_all_repos.py [--quiet]")
+    raise SystemExit(1)
+  quiet = "--quiet" in argv
+
   # Load .env.local from project root (parent of scripts/)
-  script_path = Path(__file__).resolve()
-  project_root = script_path.parent.parent
-  env_path = project_root / ".env.local"
-  load_env_from_file(env_path)
+  load_env_from_file("delete-all-repos")
   
   org = get_env_var("GITHUB_ORG_NAME")
   token = get_env_var("GITHUB_PAT")
+  GITHUB_HEADERS["Authorization"] = f"Bearer {token}"
   
   print(f"[delete-all-repos] Target organization: {org}\n")
   
-  # List all repositories
-  repos = list_all_repos(org, token)
+  # List all repositories (GraphQL is leaner; REST covers tokens it rejects)
+  repos = list_all_repos_graphql(org)
+  if repos is None:
+    repos = list_all_repos(org)
   
+  # Drop duplicates: pages fetched concurrently can overlap if the org
+  # changes mid-listing
+  repos = list({repo.get("name"): repo for repo in repos}.values())
+
   if len(repos) == 0:
     print(f"\n✅ No repositories found in {org}. Nothing to delete.")
     return
@@ -201,33 +630,27 @@ def main() -> None:
   print(f"\n{'=' * 80}")
   print(f"Found {len(repos)} repository/repositories:")
   print("=" * 80)
-  for i, repo in enumerate(repos, 1):
-    name = repo.get("name", "unknown")
-    private = repo.get("private", False)
-    visibility = "private" if private else "public"
-    print(f"  {i}. {name} ({visibility})")
-  print("=" * 80)
+  if not quiet:
+    # One write for the whole table instead of a print() per repo
+    lines = [
+      f"  {i}. {repo.get('name', 'unknown')} ({'private' if repo.get('private') else 'public'})"
+      for i, repo in enumerate(repos, 1)
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    print("=" * 80)
   
   # Require explicit confirmation
   if not confirm_deletion(len(repos), org):
     raise SystemExit(1)
   
-  # Delete each repository
+  # Delete repositories concurrently
   print("\nDeleting repositories...\n")
-  success_count = 0
-  fail_count = 0
-  
-  for i, repo in enumerate(repos, 1):
-    name = repo.get("name", "unknown")
-    print(f"[{i}/{len(repos)}] Deleting {name}...", end=" ")
-    
-    success, message = delete_repo(org, token, name)
-    print(message)
-    
-    if success:
-      success_count += 1
-    else:
-      fail_count += 1
+  names = [repo.get("name", "unknown") for repo in repos]
+  repo_url_prefix = f"{GITHUB_API_BASE}/repos/{org}/"
+  if httpx is not None:
+    success_count, fail_count = asyncio.run(delete_repos_http2(repo_url_prefix, names))
+  else:
+    success_count, fail_count = delete_repos_threaded(repo_url_prefix, names)
   
   # Summary
   print("\n" + "=" * 80)
@@ -241,7 +664,7 @@ def main() -> None:
 
 if __name__ == "__main__":
   try:
-    main()
+    main(sys.argv)
   except KeyboardInterrupt:
     print("\n\n⚠️  Operation interrupted by user.")
     raise SystemExit(1)
@@ -23,57 +23,34 @@ Note: Requires the 'modal' Python package: pip install modal
 import os
 import sys
 import subprocess
-from pathlib import Path
+import threading
+from types import ModuleType
 
+from _env import get_env_var, load_env_from_file
 
-def load_env_from_file(env_path: Path) -> None:
-    """
-    Minimal .env loader for .env.local
-    - Supports KEY=VALUE lines
-    - Ignores blank lines and comments
-    - Does not override already-set environment variables
-    """
-    if not env_path.exists():
-        print(f"[modal-test] .env file not found at {env_path}, relying on existing environment")
-        return
 
-    print(f"[modal-test] Loading environment from {env_path}")
+_MODAL: ModuleType | None = None
 
-    for line in env_path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
 
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
+def _ensure_modal() -> ModuleType:
+    """Import the Modal SDK and export its credentials, once per process"""
+    global _MODAL
+    if _MODAL is None:
+        try:
+            import modal
+        except ImportError:
+            raise SystemExit("Error: 'modal' package not installed. Run: pip install modal")
 
-        # Don't override variables already present in the environment
-        if key and key not in os.environ:
-            os.environ[key] = value
-
-
-def get_env_var(name: str) -> str:
-    value = os.environ.get(name)
-    if not value:
-        raise SystemExit(f"Environment variable {name} is not set")
-    return value
+        # Set Modal credentials as environment variables (Modal SDK reads these automatically)
+        os.environ["MODAL_TOKEN_ID"] = get_env_var("MODAL_TOKEN_ID")
+        os.environ["MODAL_TOKEN_SECRET"] = get_env_var("MODAL_TOKEN_SECRET")
+        _MODAL = modal
+    return _MODAL
 
 
 def create_sandbox() -> None:
     """Create a new sandbox with a bare node:20-slim image"""
-    try:
-        import modal
-    except ImportError:
-        raise SystemExit("Error: 'modal' package not installed. Run: pip install modal")
-
-    # Set Modal credentials as environment variables (Modal SDK reads these automatically)
-    token_id = get_env_var("MODAL_TOKEN_ID")
-    token_secret = get_env_var("MODAL_TOKEN_SECRET")
-    os.environ["MODAL_TOKEN_ID"] = token_id
-    os.environ["MODAL_TOKEN_SECRET"] = token_secret
+    modal = _ensure_modal()
 
     print("[modal-test] Using base image: node:20-slim")
     image = modal.Image.from_registry("node:20-slim")
@@ -100,16 +77,7 @@ def create_sandbox() -> None:
 
 def shell_into_sandbox(sandbox_id: str) -> None:
     """Shell into an existing sandbox using the Python SDK"""
-    try:
-        import modal
-    except ImportError:
-        raise SystemExit("Error: 'modal' package not installed. Run: pip install modal")
-
-    # Set Modal credentials as environment variables
-    token_id = get_env_var("MODAL_TOKEN_ID")
-    token_secret = get_env_var("MODAL_TOKEN_SECRET")
-    os.environ["MODAL_TOKEN_ID"] = token_id
-    os.environ["MODAL_TOKEN_SECRET"] = token_secret
+    modal = _ensure_modal()
     
     print(f"[modal-test] Connecting to sandbox {sandbox_id}...")
     
@@ -124,16 +92,7 @@ def shell_into_sandbox(sandbox_id: str) -> None:
 
 def delete_sandbox(sandbox_id: str) -> None:
     """Terminate an existing sandbox"""
-    try:
-        import modal
-    except ImportError:
-        raise SystemExit("Error: 'modal' package not installed. Run: pip install modal")
-
-    # Set Modal credentials as environment variables
-    token_id = get_env_var("MODAL_TOKEN_ID")
-    token_secret = get_env_var("MODAL_TOKEN_SECRET")
-    os.environ["MODAL_TOKEN_ID"] = token_id
-    os.environ["MODAL_TOKEN_SECRET"] = token_secret
+    modal = _ensure_modal()
 
     print(f"[modal-test] Terminating sandbox {sandbox_id}...")
 
@@ -148,18 +107,20 @@ def delete_sandbox(sandbox_id: str) -> None:
             print(f"[modal-test] ❌ Failed to terminate sandbox: {e}")
 
 
-def exec_in_sandbox(sandbox_id: str, command: list[str]) -> None:
-    """Execute a command in an existing sandbox"""
+def _drain_stream(stream, sink, errors: list[Exception]) -> None:
+    """Copy a sandbox output stream to a local file, recording any error for the caller"""
     try:
-        import modal
-    except ImportError:
-        raise SystemExit("Error: 'modal' package not installed. Run: pip install modal")
+        for chunk in stream:
+            sink.write(chunk)
+    except Exception as e:
+        errors.append(e)
+    finally:
+        sink.flush()
 
-    # Set Modal credentials as environment variables
-    token_id = get_env_var("MODAL_TOKEN_ID")
-    token_secret = get_env_var("MODAL_TOKEN_SECRET")
-    os.environ["MODAL_TOKEN_ID"] = token_id
-    os.environ["MODAL_TOKEN_SECRET"] = token_secret
+
+def exec_in_sandbox(sandbox_id: str, command: list[str]) -> None:
+    """Execute a command in an existing sandbox"""
+    modal = _ensure_modal()
 
     print(f"[modal-test] Executing command in sandbox {sandbox_id}: {' '.join(command)}")
 
@@ -167,11 +128,18 @@ def exec_in_sandbox(sandbox_id: str, command: list[str]) -> None:
         sandbox = modal.Sandbox.from_id(sandbox_id)
         process = sandbox.exec(*command)
         
-        # Stream output
-        for line in process.stdout:
-            print(line, end="")
-        for line in process.stderr:
-            print(line, end="", file=sys.stderr)
+        # Drain stdout and stderr concurrently so neither blocks on the other
+        errors: list[Exception] = []
+        drains = [
+            threading.Thread(target=_drain_stream, args=(process.stdout, sys.stdout, errors)),
+            threading.Thread(target=_drain_stream, args=(process.stderr, sys.stderr, errors)),
+        ]
+        for drain in drains:
+            drain.start()
+        for drain in drains:
+            drain.join()
+        if errors:
+            raise errors[0]
         
         exit_code = process.wait()
         print(f"\n[modal-test] Command exited with code: {exit_code}")
@@ -201,10 +169,7 @@ def main(argv: list[str]) -> None:
     action = argv[1]
 
     # Load .env.local from project root (parent of scripts/)
-    script_path = Path(__file__).resolve()
-    project_root = script_path.parent.parent
-    env_path = project_root / ".env.local"
-    load_env_from_file(env_path)
+    load_env_from_file("modal-test")
 
     if action == "create":
         create_sandbox()